@@ -67,12 +67,79 @@ Structure:
 """
 
 import itertools
+import json
+import numpy as np
+import os
 import pulp
-import string
+import scipy.sparse
+import sys
+try:
+    import highspy
+except ImportError:  # HiGHS wrapper below reports itself unavailable, CBC is used instead
+    highspy = None
+
+
+class HiGHS(pulp.HiGHS):
+    """
+    pulp.HiGHS, but the model is handed to HiGHS in one passModel call.
+    The constraint matrix is assembled as a CSR matrix from (row, col, coefficient) triplets,
+    instead of adding one column and one row at a time.
+    With warmStart=True, the current (initial) values of the variables are given to HiGHS as a MIP start.
+    """
+    def __init__(self, warmStart=False, **kwargs):
+        super().__init__(**kwargs)
+        self.warmStart = warmStart
+
+    def buildSolverModel(self, lp):
+        inf = highspy.kHighsInf
+        obj_mult = -1 if lp.sense == pulp.LpMaximize else 1
+
+        variables = lp.variables()
+        for col, var in enumerate(variables):
+            var.index = col
+        rows, cols, data = [], [], []
+        row_lower, row_upper = [], []
+        for row, constraint in enumerate(lp._constraints.values()):
+            constraint.index = row
+            for var, coefficient in constraint.items():
+                if coefficient != 0:
+                    rows.append(row)
+                    cols.append(var.index)
+                    data.append(coefficient)
+            lb, ub = constraint.getLb(), constraint.getUb() # the sense is encoded in the row bounds
+            row_lower.append(-inf if lb is None else lb)
+            row_upper.append(inf if ub is None else ub)
+        A = scipy.sparse.csr_matrix((data, (rows, cols)), shape=(len(row_lower), len(variables)))
+
+        model = highspy.HighsLp()
+        model.num_col_ = len(variables)
+        model.num_row_ = len(row_lower)
+        model.col_cost_ = [obj_mult * lp.objective.get(var, 0.0) for var in variables]
+        model.col_lower_ = [-inf if var.lowBound is None else var.lowBound for var in variables]
+        model.col_upper_ = [inf if var.upBound is None else var.upBound for var in variables]
+        model.row_lower_ = row_lower
+        model.row_upper_ = row_upper
+        model.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        model.a_matrix_.start_ = A.indptr
+        model.a_matrix_.index_ = A.indices
+        model.a_matrix_.value_ = A.data
+        model.integrality_ = [
+            highspy.HighsVarType.kInteger if var.cat == pulp.LpInteger and self.mip else highspy.HighsVarType.kContinuous
+            for var in variables
+        ]
+        lp.solverModel.passModel(model)
+
+    def callSolver(self, lp):
+        if self.warmStart:
+            # partial starts are fine: HiGHS completes the missing values itself
+            start = [(var.index, var.varValue) for var in lp.variables() if var.varValue is not None]
+            if start:
+                index, value = zip(*start)
+                lp.solverModel.setSolution(len(start), np.array(index, dtype=np.int32), np.array(value, dtype=np.float64))
+        super().callSolver(lp)
 
 
 # define constants/initial values
-VERY_LARGE_NUM = 1e8
 VERY_SMALL_NUM = 1e-3
 # horizon (extra 1 since python starts from 0)
 Y = 10+1
@@ -80,17 +147,19 @@ max_HR_fraction = 0.5 # maximum fraction of BS that can be given as HR income
 SeniorPersons = ['m', 'p']
 Persons = SeniorPersons + ['n']
 Investments = ['i', 'g']
+Brackets = ['A', 'B', 'C']  # tax brackets: up to 5e5, up to 10e5, above 10e5
 Person_Investments = list(itertools.product(Persons, Investments))
-SAL_c = {y: round(30e5 * (1 + 0.1) ** y, -2) for y in range(Y)} # 10% growth in salary
-BS_c = {y: 0.4*SAL_c[y] for y in range(Y)} # 40% of salary as BS
-SR_c = {y: round(1.74e5 * (1 + 0.1) ** y, -2) for y in range(Y)} # assume 10% growth in shop rental income
+years = np.arange(Y)
+SAL_c = np.round(30e5 * (1 + 0.1) ** years, -2) # 10% growth in salary
+BS_c = 0.4*SAL_c # 40% of salary as BS
+SR_c = np.round(1.74e5 * (1 + 0.1) ** years, -2) # assume 10% growth in shop rental income
 DF_lim = {'m': 0.5e5, 'p': 0.5e5, 'n': 0.5e5}  # fixed deductions limit (0.5e5 TTA for m/p and 0.5e5 std_ded for n)
 D_lim = {'m': 3e5, 'p': 3e5, 'n': 2.75e5}  # total deductions limit (fixed dec + 2e5 80C/CCD-1B, 0.25e5/0.5e5 80D)
 DD_lim = {p: D_lim[p]-DF_lim[p] for p in Persons}  # discretionary deductions limit
 A0 = {
     'm': {'i': 20e5, 'g': 11.595e5},
     'p': {'i': 17e5, 'g': 2.25e5},
-    'n': {'i': 0, 'g': 0}
+    'n': {'i': 0, 'g': 0}  # n starts with no wealth, but builds it up by investing disposable income (K['n'] > 0)
 }
 r = {
     'm': {'i': [0.08887] * Y, 'g': [0.09844] * Y}, # g: # 9.5% p.a. compounded quarterly
@@ -98,15 +167,20 @@ r = {
     'n': {'i': [0.09308] * Y, 'g': [0.09308] * Y}, # 9% p.a. compounded quarterly
 }
 d = {p: [1] * Y for p in Persons}
-rho = [round((1-0)**y, 4) for y in range(Y)]  # discounting factor for future tax liabilities
+rho = np.round((1-0.0)**years, 4)  # discounting factor for future tax liabilities
 
 # define the LP problem
 problem = pulp.LpProblem("Investment_Optimization", pulp.LpMinimize)
 
 # define choice variables
-f = {p: pulp.LpVariable(f'f_{p}', 0, 1, cat='Continuous') for p in ['m', 'p']}
+# the whole max_HR_fraction is always paid out as HR (the f['m'] + f['p'] <= max_HR_fraction bound is tight), so p gets the rest
+f = {'m': pulp.LpVariable('f_m', 0, max_HR_fraction, cat='Continuous')}
+f['p'] = max_HR_fraction - f['m']
 # combined for y and person
 DF = {p: pulp.LpVariable.dict(f'DF_{p}', range(Y), DF_lim[p], cat='Continuous') for p in Persons}
+# D is not fixed at its upper bound: deductions lower T but also K (>= 0), and the tax jump at 5e5 can make the
+# resulting change in future income cost more. NB: DF_lim is passed positionally as DF's *lower* bound, although
+# the docstring calls it an upper limit, so D <= DF + DD_lim is kept below rather than treated as redundant.
 D = {p: pulp.LpVariable.dict(f'D_{p}', range(Y), 0, D_lim[p], cat='Continuous') for p in Persons}
 
 # variable definitions
@@ -123,208 +197,189 @@ SR = {
     'p': {y: 0 for y in range(Y)},
     'n': {y: 0 for y in range(Y)},
 }
-HR = {
-    p: {
-        y: pulp.LpVariable(f'HR_{p}_{y}', lowBound=0, cat='Continuous')
-        for y in range(Y)
-    }
-    for p in Persons
-}
-I = {
-    p: {
-        i: {
-            y: pulp.LpVariable(f'I_{p}_{i}_{y}', lowBound=0, cat='Continuous')
-            for y in range(Y)
-        }
-        for i in Investments
-    }
-    for p in Persons
-}
-A = {
-    p: {
-        i: {
-            y: pulp.LpVariable(f'A_{p}_{i}_{y}', lowBound=0, cat='Continuous')
-            for y in range(Y)
-        }
-        for i in Investments
-    }
-    for p in Persons
-}
-t = {
-    p: {
-        y: pulp.LpVariable(f't_{p}_{y}', lowBound=0, cat='Continuous')
-        for y in range(Y)
-    }
-    for p in Persons
-}
-F = {
-    p: {
-        i: {
-            y: pulp.LpVariable(f'F_{p}_{i}_{y}', cat='Continuous')
-            for y in range(Y)
-        }
-        for i in Investments
-    }
-    for p in Persons
-}  # F (new investment) can be negative
-T = {
-    p: {
-        y: pulp.LpVariable(f'T_{p}_{y}', lowBound=0, cat='Continuous')
-        for y in range(Y)
-    }
-    for p in Persons
-}
-E = {
+# upper bound on taxable income (big-M of the top tax bracket). Wealth can grow at most by all salary and
+# shop rental plus the returns on itself: W[y] <= W[y-1] + SAL[y] + SR[y] + r_max * W[y]
+r_max = max(max(r[p][i]) for (p,i) in Person_Investments)
+W_max = {0: sum(A0[p][i] for (p,i) in Person_Investments)}
+for y in range(1, Y):
+    W_max[y] = (W_max[y-1] + SAL_c[y] + SR_c[y]) / (1 - r_max)
+T_max = {
     p: {
-        y: pulp.LpVariable(f'E_{p}_{y}', lowBound=0, cat='Continuous')
+        y: SAL[p][y] + SR[p][y] + (max_HR_fraction * BS_c[y] if p in SeniorPersons else 0) + r_max * W_max[y]
         for y in range(Y)
     }
     for p in Persons
 }
-K = {
-    p: {
-        y: pulp.LpVariable(f'K_{p}_{y}', lowBound=0, cat='Continuous')
-        for y in range(Y)
-    }
-    for p in Persons
+HR = {
+    **{p: {y: f[p] * BS['n'][y] for y in range(Y)} for p in SeniorPersons},  # affine in f, BS is a known constant
+    'n': {y: 0 for y in range(Y)},
 }
+A = pulp.LpVariable.dicts('A', (Persons, Investments, range(Y)), lowBound=0, cat='Continuous')
+I = {p: {i: {y: r[p][i][y] * A[p][i][y] for y in range(Y)} for i in Investments} for p in Persons}  # affine in A, r is a known constant
+t = pulp.LpVariable.dicts('t', (Persons, range(Y)), lowBound=0, cat='Continuous')
+F = pulp.LpVariable.dicts('F', (Persons, Investments, range(Y)), cat='Continuous')  # F (new investment) can be negative
+T = pulp.LpVariable.dicts('T', (Persons, range(Y)), lowBound=0, cat='Continuous')
+E = pulp.LpVariable.dicts('E', (Persons, range(Y)), lowBound=0, cat='Continuous')
+K = pulp.LpVariable.dicts('K', (Persons, range(Y)), lowBound=0, cat='Continuous')
 
 # Binary variables to represent the tax brackets
-b = {
-    p: {
-        y: {
-            string.ascii_uppercase[cnt] : pulp.LpVariable(f'b_{p}_{y}_{cnt}', cat='Binary')
-            for cnt in range(3)
-        }
-        for y in range(Y)
-    }
-    for p in Persons
-}
-tax_comp = {
-    p: {
-        y: {
-            string.ascii_uppercase[cnt]: pulp.LpVariable(f'tax_comp_{p}_{y}_{cnt}', lowBound=0, cat='Continuous')
-            for cnt in range(3)
-        }
-        for y in range(Y)
-    }
-    for p in Persons
-}
+b = pulp.LpVariable.dicts('b', (Persons, range(Y), Brackets), cat='Binary')
+tax_comp = pulp.LpVariable.dicts('tax_comp', (Persons, range(Y), Brackets), lowBound=0, cat='Continuous')
+# Taxable income split across the tax brackets (only the slice of the active bracket is non-zero)
+T_comp = pulp.LpVariable.dicts('T_comp', (Persons, range(Y), Brackets), lowBound=0, cat='Continuous')
 
 
 # objective function (include rho as well)
-problem += pulp.lpSum(rho[y] * t[p][y] for p in Persons for y in range(Y))
+problem += pulp.LpAffineExpression((t[p][y], rho[y]) for p in Persons for y in range(Y))
 
 
 # initial values
-for (p,i) in Person_Investments:
-    problem += A[p][i][0] == A0[p][i]
+problem.extend(A[p][i][0] == A0[p][i] for (p,i) in Person_Investments)
 
-# constraints
-for y in range(Y):
-    # income constraints
-    for (p,i) in Person_Investments:
-        problem += I[p][i][y] == r[p][i][y] * A[p][i][y]
+# constraints (single-row families are added in one go, across all years)
+# wealth constraints
+problem.extend(A[p]['i'][y] == A[p]['i'][y - 1] + F[p]['i'][y] for y in range(1, Y) for p in Persons)
+problem.extend(A[p]['g'][y] == A[p]['g'][y - 1] + F[p]['g'][y] + I[p]['g'][y] for y in range(1, Y) for p in Persons)
 
-    # wealth constraints
-    if y > 0:
-        for p in Persons:
-            problem += A[p]['i'][y] == A[p]['i'][y - 1] + F[p]['i'][y]
-            problem += A[p]['g'][y] == A[p]['g'][y - 1] + F[p]['g'][y] + I[p]['g'][y]
+# fixed and total deductions constraints
+problem.extend(D[p][y] >= DF[p][y] for y in range(Y) for p in Persons)
+problem.extend(D[p][y] <= DF[p][y] + DD_lim[p] for y in range(Y) for p in Persons)
 
-    # fixed and total deductions constraints
-    for p in Persons:
-        problem += D[p][y] >= DF[p][y]
-        problem += D[p][y] <= DF[p][y] + DD_lim[p]
+# expense constraints
+problem.extend(E[p][y] == SR[p][y] + I[p]['i'][0] for y in range(Y) for p in SeniorPersons)  # expenses equal to SR and period-0 I
+problem.extend(E['n'][y] == BS['n'][y] + HR['m'][y] + HR['p'][y] for y in range(Y))  # assumption: n's expenses equal to BS plus HR given to m and p
 
-    # HR and BS constraints for m and p
-    problem += HR['m'][y] == f['m'] * BS['n'][y]
-    problem += HR['p'][y] == f['p'] * BS['n'][y]
-    problem += f['m'] + f['p'] <= max_HR_fraction
+# investment constraints
+problem.extend(F[p]['g'][y] == d[p][y] * K[p][y] for y in range(Y) for p in Persons)
+problem.extend(F[p]['i'][y] == (1 - d[p][y]) * K[p][y] for y in range(Y) for p in Persons)
 
-    # total taxable income constraints
+# multi-term constraints, built per year and person and added per family after the loop
+taxable_cs, bracket_cs, tax_cs, disposable_cs = [], [], [], []
+for y in range(Y):
     for p in Persons:
-        # including
-        problem += T[p][y] == (
-            SAL[p][y] + # salary
-            SR[p][y] + # shop rental
-            HR[p][y] + # home rental
-            I[p]['i'][y] + # interest from interest-bearing debt
-            I[p]['g'][y] - # interest from growth investment
-            D[p][y] - # deductions
-            0.3*(HR[p][y] + SR[p][y]) - # 30% of rental income
-            (0.12+0.1)*BS[p][y] - # 12% in comp PF and 10% in comp NPS
-            (f['m']+f['p'] - 0.1)*BS[p][y] # fraction of BS paid to m/p minus 10% of BS (only applies to n)
-        )
+        # variables used by several rows below
+        HR_py, D_py, t_py = HR[p][y], D[p][y], t[p][y]
+        A_pi, A_pg = A[p]['i'][y], A[p]['g'][y]
+        b_py, T_comp_py, tax_comp_py = b[p][y], T_comp[p][y], tax_comp[p][y]
 
+        # total taxable income constraints (SAL and BS are zero for m/p, HR and SR are zero for n)
+        taxable = pulp.LpAffineExpression([
+            (A_pi, r[p]['i'][y]), # interest from interest-bearing debt
+            (A_pg, r[p]['g'][y]), # interest from growth investment
+            (D_py, -1), # deductions
+        ])
+        if p in SeniorPersons:
+            taxable.addInPlace(
+                (1 - 0.3)*HR_py + # home rental net of 30% of rental income
+                (1 - 0.3)*SR[p][y] # shop rental net of 30% of rental income
+            )
+        else:
+            taxable.addInPlace(
+                SAL[p][y] - # salary
+                (0.12+0.1)*BS[p][y] - # 12% in comp PF and 10% in comp NPS
+                (max_HR_fraction - 0.1)*BS[p][y] # fraction of BS paid to m/p minus 10% of BS
+            )
+        taxable_cs.append(T[p][y] == taxable)
 
-    # tax constraints
-    for p in Persons:
         # tax constraints for b
-        problem += b[p][y]['A'] + b[p][y]['B'] + b[p][y]['C'] == 1
-        # total income
-        problem += T[p][y] <= 5e5 + (1 - b[p][y]['A']) * VERY_LARGE_NUM
-        problem += T[p][y] >= (5e5 + VERY_SMALL_NUM) * b[p][y]['B']
-        problem += T[p][y] <= 10e5 + (1 - b[p][y]['B']) * VERY_LARGE_NUM
-        problem += T[p][y] >= (10e5 + VERY_SMALL_NUM) * b[p][y]['C']
-        # tax component-1
-        problem += tax_comp[p][y]['A'] <= 0
-        # tax component-2
-        problem += tax_comp[p][y]['B'] <= 1.04 * (0.2 * T[p][y] - 87500 * b[p][y]['B'])
-        problem += tax_comp[p][y]['B'] <= 1.04 * (VERY_LARGE_NUM * b[p][y]['B'])
-        problem += tax_comp[p][y]['B'] >= 1.04 * (0.2 * T[p][y] - 87500 - VERY_LARGE_NUM * (1 - b[p][y]['B']))
-        # tax component-3
-        problem += tax_comp[p][y]['C'] <= 1.04 * (0.3 * T[p][y] - 187500 * b[p][y]['C'])
-        problem += tax_comp[p][y]['C'] <= 1.04 * (VERY_LARGE_NUM * b[p][y]['C'])
-        problem += tax_comp[p][y]['C'] >= 1.04 * (0.3 * T[p][y] - 187500 - VERY_LARGE_NUM * (1 - b[p][y]['C']))
-        # final tax liability
-        problem += t[p][y] == tax_comp[p][y]['A'] + tax_comp[p][y]['B'] + tax_comp[p][y]['C']
+        bracket_cs.append(b_py['A'] + b_py['B'] + b_py['C'] == 1)
+        # total income (disaggregated over the brackets: the top bracket is bounded by T_max)
+        bracket_cs += [
+            T[p][y] == T_comp_py['A'] + T_comp_py['B'] + T_comp_py['C'],
+            T_comp_py['A'] <= 5e5 * b_py['A'],
+            T_comp_py['B'] >= (5e5 + VERY_SMALL_NUM) * b_py['B'],
+            T_comp_py['B'] <= 10e5 * b_py['B'],
+            T_comp_py['C'] >= (10e5 + VERY_SMALL_NUM) * b_py['C'],
+            T_comp_py['C'] <= T_max[p][y] * b_py['C'],
+        ]
+        tax_cs += [
+            # tax component-1
+            tax_comp_py['A'] <= 0,
+            # tax component-2 (zero along with T_comp when b is zero)
+            tax_comp_py['B'] == 0.2 * T_comp_py['B'] - 87500 * b_py['B'],
+            # tax component-3
+            tax_comp_py['C'] == 0.3 * T_comp_py['C'] - 187500 * b_py['C'],
+            # final tax liability (4% surcharge applied once, on the sum of the components)
+            t_py == 1.04 * (tax_comp_py['A'] + tax_comp_py['B'] + tax_comp_py['C']),
+        ]
 
-    # expense constraints
-    for p in SeniorPersons:
-        problem += E[p][y] == SR[p][y] + I[p]['i'][0]  # expenses equal to SR and period-0 I
-    problem += E['n'][y] == BS['n'][y] + HR['m'][y] + HR['p'][y]  # assumption: n's expenses equal to BS plus HR given to m and p
+        # disposable income constraints
+        disposable_cs.append(K[p][y] == pulp.LpAffineExpression([
+            (A_pi, r[p]['i'][y]), (DF[p][y], 1), (D_py, -1), (E[p][y], -1), (t_py, -1)
+        ]).addInPlace(HR_py + SR[p][y] if p in SeniorPersons else SAL[p][y]))
+for constraints in (taxable_cs, bracket_cs, tax_cs, disposable_cs):
+    problem.extend(constraints)
 
-    # disposable income constraints
-    for p in Persons:
-        problem += K[p][y] == SAL[p][y] + SR[p][y] + HR[p][y] + I[p]['i'][y] + DF[p][y] - D[p][y] - E[p][y] - t[p][y]
 
-    # investment constraints
-    for p in Persons:
-        problem += F[p]['g'][y] == d[p][y] * K[p][y]
-        problem += F[p]['i'][y] == (1 - d[p][y]) * K[p][y]
-
-
-# solve the problem
-problem.solve()
+# solve the problem (warm-started from the solution of the previous run, if any)
+solver_class = HiGHS if HiGHS().available() else pulp.PULP_CBC_CMD
+solver_options = dict(msg=False, threads=os.cpu_count())
+warm_start_file = 'warm_start.json'
+if os.path.exists(warm_start_file):
+    with open(warm_start_file) as fh:
+        warm_start = json.load(fh)
+    for var in problem.variables():
+        if var.name in warm_start:
+            var.setInitialValue(warm_start[var.name], check=False)
+else:
+    # otherwise, start from the tax brackets the LP relaxation puts T in (HiGHS/CBC fill in the continuous variables)
+    problem.solve(solver_class(mip=False, **solver_options))
+    relaxation_optimal = problem.sol_status == pulp.LpSolutionOptimal
+    T_relaxed = {p: {y: T[p][y].varValue for y in range(Y)} for p in Persons}
+    # the start holds nothing but the bracket binaries of an optimal relaxation (never fractional/stale b values)
+    for var in problem.variables():
+        var.varValue = None
+    if relaxation_optimal:
+        for p in Persons:
+            for y in range(Y):
+                bracket = 'A' if T_relaxed[p][y] <= 5e5 else 'B' if T_relaxed[p][y] <= 10e5 else 'C'
+                for k in Brackets:
+                    b[p][y][k].setInitialValue(1 if k == bracket else 0)
+problem.solve(solver_class(warmStart=True, **solver_options))
+# pulp reports LpStatusOptimal for any incumbent, only a proven optimum is kept as the next warm start
+if problem.sol_status == pulp.LpSolutionOptimal:
+    with open(warm_start_file, 'w') as fh:
+        json.dump({var.name: var.varValue for var in problem.variables()}, fh)
+else:
+    sys.stderr.write(f"warning: solution is not proven optimal ({pulp.LpSolution[problem.sol_status]})\n")
 
 # print combined useful values for each year
 rounding = -2
 frequency = 1 # 1 annual, 12 monthly
-print(f"fraction:                              --->    'm':{round(f['m'].varValue, 4):.4f}, 'p':{round(f['p'].varValue, 4):.4f}")
+lines = [] # written to stdout in one go
+# solution values, indexed [person, (investment,) year]
+senior, n_idx = [Persons.index(p) for p in SeniorPersons], Persons.index('n')
+i_idx, g_idx = Investments.index('i'), Investments.index('g')
+F_vals, A_vals, I_vals = (
+    np.array([[[pulp.value(x[p][i][y]) for y in range(Y)] for i in Investments] for p in Persons]) for x in (F, A, I)
+)
+D_vals, E_vals, T_vals, t_vals = (
+    np.array([[pulp.value(x[p][y]) for y in range(Y)] for p in Persons]) for x in (D, E, T, t)
+)
+lines.append(f"fraction:                              --->    'm':{round(pulp.value(f['m']), 4):.4f}, 'p':{round(pulp.value(f['p']), 4):.4f}")
 for y in range(Y):
-    print('-'*40 + f' Year: {y} ' + '-'*40)
-    print(f"Year {y}: Total (p/m) Investment:              --->    {round(sum(F[p][i][y].varValue for p in SeniorPersons for i in Investments) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (n)   Investment:              --->    {round(sum(F['n'][i][y].varValue for i in Investments) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (p/m) Wealth:                  --->    {round(sum(A[p][i][y].varValue for p in SeniorPersons for i in Investments) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (n)   Wealth:                  --->    {round(sum(A['n'][i][y].varValue for i in Investments) / frequency, rounding):,.0f}")
-    # print(f"Year {y}: Total (p/m) Fixed Deductions:        --->    {round(sum(DF[p][y].varValue for p in SeniorPersons) / frequency, rounding):,.0f}")
-    # print(f"Year {y}: Total (n)   Fixed Deductions:        --->    {round(DF['n'][y].varValue / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (p/m) Deductions:              --->    {round(sum(D[p][y].varValue for p in SeniorPersons) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (n)   Deductions:              --->    {round(D['n'][y].varValue / frequency, rounding):,.0f}")
-    # print(f"Year {y}: Total (p/m) SR Income:               --->    {round(sum(SR[p][y] for p in SeniorPersons) / frequency, rounding):,.0f}")
-    # print(f"Year {y}: Total (p/m) HR Income:               --->    {round(sum(HR[p][y].varValue for p in SeniorPersons) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (p/m) Expenses:                --->    {round(sum(E[p][y].varValue for p in SeniorPersons) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (n)   Expenses:                --->    {round(E['n'][y].varValue / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (p/m) interest-bearing Income: --->    {round(sum(I[p]['i'][y].varValue for p in SeniorPersons) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (n)   interest-bearing Income: --->    {round(I['n']['i'][y].varValue / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (p/m) growth Income:           --->    {round(sum(I[p]['g'][y].varValue for p in SeniorPersons) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total (n)   growth Income:           --->    {round(I['n']['g'][y].varValue / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total Taxable Income:                --->    {round(sum(T[p][y].varValue for p in Persons) / frequency, rounding):,.0f}")
-    print(f"Year {y}: Total Tax Liability:                 --->    {round(sum(t[p][y].varValue for p in Persons) / frequency, rounding):,.0f}")
-    for p in Persons:
-        print(f"Year {y}: {p}'s Taxable Income:                  --->    {round(T[p][y].varValue / frequency, rounding):,.0f}")
-    for p in Persons:
-        print(f"Year {y}: {p}'s Tax Liability:                   --->    {round(t[p][y].varValue / frequency, rounding):,.0f}")
-
+    lines.append('-'*40 + f' Year: {y} ' + '-'*40)
+    lines.append(f"Year {y}: Total (p/m) Investment:              --->    {round(F_vals[senior, :, y].sum() / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (n)   Investment:              --->    {round(F_vals[n_idx, :, y].sum() / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (p/m) Wealth:                  --->    {round(A_vals[senior, :, y].sum() / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (n)   Wealth:                  --->    {round(A_vals[n_idx, :, y].sum() / frequency, rounding):,.0f}")
+    # lines.append(f"Year {y}: Total (p/m) Fixed Deductions:        --->    {round(sum(DF[p][y].varValue for p in SeniorPersons) / frequency, rounding):,.0f}")
+    # lines.append(f"Year {y}: Total (n)   Fixed Deductions:        --->    {round(DF['n'][y].varValue / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (p/m) Deductions:              --->    {round(D_vals[senior, y].sum() / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (n)   Deductions:              --->    {round(D_vals[n_idx, y] / frequency, rounding):,.0f}")
+    # lines.append(f"Year {y}: Total (p/m) SR Income:               --->    {round(sum(SR[p][y] for p in SeniorPersons) / frequency, rounding):,.0f}")
+    # lines.append(f"Year {y}: Total (p/m) HR Income:               --->    {round(sum(pulp.value(HR[p][y]) for p in SeniorPersons) / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (p/m) Expenses:                --->    {round(E_vals[senior, y].sum() / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (n)   Expenses:                --->    {round(E_vals[n_idx, y] / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (p/m) interest-bearing Income: --->    {round(I_vals[senior, i_idx, y].sum() / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (n)   interest-bearing Income: --->    {round(I_vals[n_idx, i_idx, y] / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (p/m) growth Income:           --->    {round(I_vals[senior, g_idx, y].sum() / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total (n)   growth Income:           --->    {round(I_vals[n_idx, g_idx, y] / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total Taxable Income:                --->    {round(T_vals[:, y].sum() / frequency, rounding):,.0f}")
+    lines.append(f"Year {y}: Total Tax Liability:                 --->    {round(t_vals[:, y].sum() / frequency, rounding):,.0f}")
+    for j, p in enumerate(Persons):
+        lines.append(f"Year {y}: {p}'s Taxable Income:                  --->    {round(T_vals[j, y] / frequency, rounding):,.0f}")
+    for j, p in enumerate(Persons):
+        lines.append(f"Year {y}: {p}'s Tax Liability:                   --->    {round(t_vals[j, y] / frequency, rounding):,.0f}")
 
+sys.stdout.write('\n'.join(lines) + '\n')